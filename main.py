@@ -1,22 +1,27 @@
 """
 Telegram GPU Monitor Bot
-- Polls the API every 1 second for GPU 'busy' status
+- Polls the API every 1 second for GPU 'busy' status (while anyone is subscribed)
 - Lets users subscribe to be notified when a specific GPU becomes NOT busy
 
 Requirements:
 - Python 3.10+
 - python-telegram-bot (v20+)
 - aiohttp
+- orjson
+- uvloop (not on Windows)
 """
 
 import asyncio
-import json
 import logging
 import os
+import sqlite3
+import sys
+from collections import OrderedDict, defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import DefaultDict, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import aiohttp
+import orjson
 from dotenv import load_dotenv
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import (
@@ -24,6 +29,8 @@ from telegram.ext import (
     CallbackQueryHandler,
     CommandHandler,
     ContextTypes,
+    PersistenceInput,
+    PicklePersistence,
 )
 
 load_dotenv()
@@ -31,8 +38,25 @@ load_dotenv()
 # ------- Configuration -------
 API_URL = "https://api.ferdowsi.cloud/api/v2/sm/mhd-fum1/flavors/gpus"
 POLL_INTERVAL_SECONDS = 1  # per your request
-SUBSCRIPTIONS_FILE = Path("subscriptions.json")
+STATE_FILE = Path("state.pkl")
+PERSISTENCE_INTERVAL_SECONDS = 60  # batch chat_data writes to STATE_FILE
+# older storage formats, imported into chat_data once and then renamed
+LEGACY_SUBSCRIPTIONS_FILE = Path("subscriptions.json")
+LEGACY_SUBSCRIPTIONS_DB = Path("subscriptions.db")
 TELEGRAM_TOKEN = os.environ.get("TELEGRAM_TOKEN")
+HTTP_TIMEOUT_SECONDS = 10
+# keep idle connections around longer than aiohttp's 15s default so sparse
+# handler-triggered requests still reuse the poller's TCP/TLS connection
+HTTP_KEEPALIVE_SECONDS = 75
+# caps notification sends in flight at once; this is not a per-second rate
+# limit, so bursts can still exceed Telegram's ~30 messages/sec
+MAX_CONCURRENT_SENDS = 30
+MAX_DISPLAY_NAMES = 1024
+
+# ------- Messages -------
+NOTIFY_TEMPLATE = "\U0001f6a8 %s is now AVAILABLE!\nGPU id: %s"  # display name, gpu id
+NOTIFY_MANY_HEADER = "\U0001f6a8 Available now:\n"
+NOTIFY_MANY_LINE = "- %s (%s)"  # display name, gpu id
 
 # ------- Logging -------
 logging.basicConfig(level=logging.INFO)
@@ -40,59 +64,164 @@ logger = logging.getLogger(__name__)
 
 
 # ------- Persistence helpers -------
-def load_subscriptions() -> Dict[str, List[int]]:
-    """Return mapping gpu_name -> list of chat_ids"""
-    if not SUBSCRIPTIONS_FILE.exists():
-        return {}
+# A chat's subscriptions live in its chat_data["gpus"] (set of gpu names),
+# which PicklePersistence saves to STATE_FILE.
+def load_subscriptions(chat_data: Mapping[int, dict]) -> Dict[str, Set[int]]:
+    """Return mapping gpu_name -> set of chat_ids"""
+    subs: Dict[str, Set[int]] = {}
+    for chat_id, data in chat_data.items():
+        for gpu in data.get("gpus", ()):
+            subs.setdefault(gpu, set()).add(chat_id)
+    return subs
+
+
+def read_legacy_subscriptions() -> List[Tuple[str, int]]:
+    """Return (gpu_name, chat_id) pairs from the old JSON file and SQLite db."""
+    pairs: List[Tuple[str, int]] = []
+    if LEGACY_SUBSCRIPTIONS_FILE.exists():
+        data = orjson.loads(LEGACY_SUBSCRIPTIONS_FILE.read_bytes())
+        pairs += [(gpu, int(chat)) for gpu, chats in data.items() for chat in chats]
+    if LEGACY_SUBSCRIPTIONS_DB.exists():
+        db = sqlite3.connect(LEGACY_SUBSCRIPTIONS_DB)
+        try:
+            pairs += [
+                (gpu, int(chat))
+                for gpu, chat in db.execute("SELECT gpu, chat FROM subs")
+            ]
+            # fold the WAL from the old SQLite store back into the db file, so
+            # the renamed copy is complete and no -wal/-shm files are left
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            db.close()
+    return pairs
+
+
+async def import_legacy_subscriptions(app) -> None:
+    """Move subscriptions from subscriptions.json/.db into chat_data, once."""
     try:
-        with SUBSCRIPTIONS_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            # ensure lists of ints
-            return {k: [int(x) for x in v] for k, v in data.items()}
-    except Exception as e:
-        logger.exception("Failed to load subscriptions: %s", e)
-        return {}
-
-
-def save_subscriptions(subs: Dict[str, List[int]]) -> None:
-    try:
-        with SUBSCRIPTIONS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(subs, f, indent=2)
+        pairs = read_legacy_subscriptions()
+        if pairs:
+            for gpu, chat_id in pairs:
+                app.chat_data[chat_id].setdefault("gpus", set()).add(gpu)
+            app.mark_data_for_update_persistence(
+                chat_ids={chat_id for _, chat_id in pairs}
+            )
+            # write STATE_FILE now so renaming the old files can't lose data
+            await app.update_persistence()
+        for path in (LEGACY_SUBSCRIPTIONS_FILE, LEGACY_SUBSCRIPTIONS_DB):
+            if path.exists():
+                path.rename(path.with_name(path.name + ".migrated"))
     except Exception as e:
-        logger.exception("Failed to save subscriptions: %s", e)
+        logger.exception("Failed to import legacy subscriptions: %s", e)
 
 
 # ------- Global state (in-memory) -------
-subscriptions: Dict[str, List[int]] = load_subscriptions()
-prev_states: Dict[str, bool] = {}  # gpu_name -> busy
-gpu_display_names: Dict[str, str] = {}  # gpu_name -> display_name
+subscriptions: Dict[str, Set[int]] = {}  # hydrated from chat_data in post_init
+# last polled GPU list as parallel tuples: gpu_names[i] -> prev_states[i] (busy)
+gpu_names: Tuple[str, ...] = ()
+prev_states: Tuple[bool, ...] = ()
+# gpu_name -> display_name; rebuilt by the poller, capped at MAX_DISPLAY_NAMES
+gpu_display_names: "OrderedDict[str, str]" = OrderedDict()
+
+
+def remember_display_name(name: str, disp: str) -> None:
+    """Record a display name, evicting the oldest entry past the cap."""
+    gpu_display_names[name] = disp
+    gpu_display_names.move_to_end(name)
+    if len(gpu_display_names) > MAX_DISPLAY_NAMES:
+        gpu_display_names.popitem(last=False)
+
+
+# ------- Application lifecycle -------
+async def post_init(app) -> None:
+    """Create the shared aiohttp session and index the persisted subscriptions."""
+    connector = aiohttp.TCPConnector(
+        limit=10,
+        limit_per_host=4,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        enable_cleanup_closed=True,
+        ttl_dns_cache=300,
+    )
+    # trust_env=False: the Ferdowsi API is reached directly, ignoring HTTP_PROXY
+    app.bot_data["http_session"] = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS),
+        headers={"Connection": "keep-alive", "Accept-Encoding": "gzip"},
+        trust_env=False,
+    )
+    app.bot_data["send_semaphore"] = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+    await import_legacy_subscriptions(app)
+    subscriptions.update(load_subscriptions(app.chat_data))
 
 
-# ------- Helper to manage two sessions (proxy vs no-proxy) -------
-def get_session_for_app(app, use_proxy: bool) -> aiohttp.ClientSession:
-    """
-    Lazily create and return a session stored in app.bot_data.
-    - use_proxy True -> session with trust_env=True (respects HTTP_PROXY)
-    - use_proxy False -> session with trust_env=False (ignores env proxy)
-    """
-    key = "http_session_proxy" if use_proxy else "http_session_noproxy"
-    session = app.bot_data.get(key)
-    if session is None:
-        session = aiohttp.ClientSession(trust_env=True if use_proxy else False)
-        app.bot_data[key] = session
-    return session
+async def post_shutdown(app) -> None:
+    """Close the shared aiohttp session."""
+    session = app.bot_data.pop("http_session", None)
+    if session is not None:
+        await session.close()
 
 
 # ------- API fetch -------
+_UNCHANGED = object()  # poll result when the API answers 304 Not Modified
+
+
 async def fetch_gpus(session: aiohttp.ClientSession) -> Optional[list]:
+    """Return the GPU list, or None on failure."""
+    gpus, _ = await fetch_gpus_conditional(session, None)
+    return gpus
+
+
+async def fetch_gpus_conditional(
+    session: aiohttp.ClientSession, validators: Optional[Dict[str, str]]
+) -> Tuple[Union[list, object, None], Optional[Dict[str, str]]]:
+    """
+    Fetch the GPU list, sending the cached If-None-Match/If-Modified-Since
+    validators. Returns (gpus, validators): gpus is the list, _UNCHANGED on
+    304 or None on failure; validators are the ones to send next time. The
+    caller should store them only once it has processed the response.
+    """
     try:
-        async with session.get(API_URL, timeout=10) as resp:
+        async with session.get(API_URL, headers=validators) as resp:
+            if resp.status == 304:
+                return _UNCHANGED, validators
             resp.raise_for_status()
-            data = await resp.json()
-            return data.get("data", [])
+            gpus = orjson.loads(await resp.read()).get("data", [])
+            new_validators = {}
+            etag = resp.headers.get("ETag")
+            if etag:
+                new_validators["If-None-Match"] = etag
+            last_modified = resp.headers.get("Last-Modified")
+            if last_modified:
+                new_validators["If-Modified-Since"] = last_modified
+            return gpus, new_validators
     except Exception as e:
         logger.warning("Failed to fetch GPUs: %s", e)
-        return None
+        return None, validators
+
+
+# ------- Keyboards -------
+# shared, immutable pieces reused by every keyboard
+BUSY_EMOJI = "🔴"
+AVAILABLE_EMOJI = "🟢"
+SUB_PREFIX = "sub|"
+UNSUB_PREFIX = "unsub|"
+_CANCEL_ROW = [InlineKeyboardButton("Cancel", callback_data="cancel")]
+
+
+def build_subscribe_keyboard(gpus: list) -> InlineKeyboardMarkup:
+    """One button per named GPU (with a busy/available emoji) plus Cancel."""
+    keyboard = []
+    for g in gpus:
+        name = g.get("name")
+        if not name:
+            continue
+        disp = g.get("display_name") or name
+        emoji = BUSY_EMOJI if g.get("busy") else AVAILABLE_EMOJI
+        keyboard.append(
+            [InlineKeyboardButton(f"{disp} {emoji}", callback_data=SUB_PREFIX + name)]
+        )
+    keyboard.append(_CANCEL_ROW)
+    return InlineKeyboardMarkup(keyboard)
 
 
 # ------- Telegram command handlers -------
@@ -105,9 +234,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def list_gpus_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    # use the NO-PROXY session for Ferdowsi API
-    app = context.application
-    session = get_session_for_app(app, use_proxy=False)
+    session = context.application.bot_data["http_session"]
     gpus = await fetch_gpus(session)
     if not gpus:
         await update.message.reply_text("Failed to fetch GPU list. Try again later.")
@@ -126,26 +253,23 @@ async def list_gpus_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Send an inline keyboard letting user pick GPUs to subscribe to."""
     chat_id = update.effective_chat.id
-    app = context.application
-    session = get_session_for_app(app, use_proxy=False)  # NO-PROXY for Ferdowsi API
-    gpus = await fetch_gpus(session)
-    if not gpus:
-        await update.message.reply_text("Failed to fetch GPU list. Try again later.")
-        return
-
-    # store display names map
-    keyboard = []
-    for g in gpus:
-        name = g.get("name")
-        disp = g.get("display_name") or name
-        busy = g.get("busy")
-        emoji = "🔴" if busy else "🟢"
-        gpu_display_names[name] = disp
-        keyboard.append(
-            [InlineKeyboardButton(f"{disp} {emoji}", callback_data=f"sub|{name}")]
-        )
-    keyboard.append([InlineKeyboardButton("Cancel", callback_data="cancel")])
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    # the poller keeps a keyboard for the latest GPU list; fetch only without one
+    reply_markup = context.application.bot_data.get("subscribe_kb")
+    if reply_markup is None:
+        session = context.application.bot_data["http_session"]
+        gpus = await fetch_gpus(session)
+        if not gpus:
+            await update.message.reply_text(
+                "Failed to fetch GPU list. Try again later."
+            )
+            return
+        # store display names map
+        for g in gpus:
+            name = g.get("name")
+            if not name:
+                continue
+            remember_display_name(name, g.get("display_name") or name)
+        reply_markup = build_subscribe_keyboard(gpus)
     await update.message.reply_text(
         "Select a GPU to be notified when it becomes AVAILABLE:",
         reply_markup=reply_markup,
@@ -153,31 +277,33 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def my_subs_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    chat_id = update.effective_chat.id
-    my = [gpu for gpu, chats in subscriptions.items() if chat_id in chats]
+    my = context.chat_data.get("gpus")
     if not my:
         await update.message.reply_text("You have no subscriptions.")
         return
     lines = ["Your subscriptions:"]
-    for g in my:
+    for g in sorted(my):
         lines.append(f"- {gpu_display_names.get(g, g)} ({g})")
     await update.message.reply_text("\n".join(lines))
 
 
 async def unsubscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # show inline keyboard of user's subscriptions
-    chat_id = update.effective_chat.id
-    my = [gpu for gpu, chats in subscriptions.items() if chat_id in chats]
+    my = context.chat_data.get("gpus")
     if not my:
         await update.message.reply_text(
             "You have no subscriptions to unsubscribe from."
         )
         return
     keyboard = [
-        [InlineKeyboardButton(gpu_display_names.get(g, g), callback_data=f"unsub|{g}")]
-        for g in my
+        [
+            InlineKeyboardButton(
+                gpu_display_names.get(g, g), callback_data=UNSUB_PREFIX + g
+            )
+        ]
+        for g in sorted(my)
     ]
-    keyboard.append([InlineKeyboardButton("Cancel", callback_data="cancel")])
+    keyboard.append(_CANCEL_ROW)
     await update.message.reply_text(
         "Select a subscription to remove:", reply_markup=InlineKeyboardMarkup(keyboard)
     )
@@ -187,11 +313,12 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # show last known states (from prev_states)
     if not prev_states:
         await update.message.reply_text(
-            "No status known yet. Wait a moment for the bot to poll the API."
+            "No status known yet. The API is only polled while someone is "
+            "subscribed; use /list to fetch the current status."
         )
         return
     lines = ["Last known GPU status:"]
-    for name, busy in prev_states.items():
+    for name, busy in zip(gpu_names, prev_states):
         disp = gpu_display_names.get(name, name)
         lines.append(f"{disp} — {'BUSY' if busy else 'AVAILABLE'}")
     await update.message.reply_text("\n".join(lines))
@@ -216,25 +343,25 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if action == "sub":
         # add subscription
-        subs = subscriptions.get(gpu_name, [])
-        if chat_id not in subs:
-            subs.append(chat_id)
-            subscriptions[gpu_name] = subs
-            save_subscriptions(subscriptions)
+        my = context.chat_data.setdefault("gpus", set())
+        if gpu_name not in my:
+            my.add(gpu_name)
+            subscriptions.setdefault(gpu_name, set()).add(chat_id)
             await query.edit_message_text(
                 f"You will be notified when {gpu_display_names.get(gpu_name, gpu_name)} becomes AVAILABLE."
             )
         else:
             await query.edit_message_text("You are already subscribed to this GPU.")
     elif action == "unsub":
-        subs = subscriptions.get(gpu_name, [])
-        if chat_id in subs:
-            subs.remove(chat_id)
-            if subs:
-                subscriptions[gpu_name] = subs
-            else:
+        my = context.chat_data.get("gpus", set())
+        if gpu_name in my:
+            my.remove(gpu_name)
+            if not my:
+                del context.chat_data["gpus"]
+            subs = subscriptions.get(gpu_name, set())
+            subs.discard(chat_id)
+            if not subs:
                 subscriptions.pop(gpu_name, None)
-            save_subscriptions(subscriptions)
             await query.edit_message_text(
                 f"Unsubscribed from {gpu_display_names.get(gpu_name, gpu_name)}."
             )
@@ -244,44 +371,130 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await query.edit_message_text("Unknown action.")
 
 
+# --- Notifications ---
+def format_notification(names: Tuple[str, ...]) -> str:
+    """Availability message for one or more GPUs that just became free."""
+    if len(names) == 1:
+        name = names[0]
+        return NOTIFY_TEMPLATE % (gpu_display_names.get(name, name), name)
+    return NOTIFY_MANY_HEADER + "\n".join(
+        NOTIFY_MANY_LINE % (gpu_display_names.get(n, n), n) for n in names
+    )
+
+
+async def notify_chats(app, chat_ids, text: str) -> None:
+    """
+    Send text to the first reachable chat, then copy that message to the
+    remaining chats concurrently, logging failed sends.
+    """
+    sem = app.bot_data["send_semaphore"]
+    targets = list(chat_ids)
+
+    source = None
+    while targets and source is None:
+        chat_id = targets.pop(0)
+        try:
+            async with sem:
+                source = await app.bot.send_message(chat_id=chat_id, text=text)
+        except Exception as e:
+            logger.warning("Failed to send notification to %s: %s", chat_id, e)
+    if source is None:
+        return
+
+    async def copy(chat_id: int):
+        async with sem:
+            try:
+                return await app.bot.copy_message(
+                    chat_id=chat_id,
+                    from_chat_id=source.chat_id,
+                    message_id=source.message_id,
+                )
+            except Exception:
+                # the source message may be gone or protected: send it fresh
+                return await app.bot.send_message(chat_id=chat_id, text=text)
+
+    results = await asyncio.gather(
+        *(copy(chat_id) for chat_id in targets), return_exceptions=True
+    )
+    for chat_id, result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to send notification to %s: %s", chat_id, result)
+
+
 # --- Poller job (runs inside JobQueue) ---
 async def poller_job(context: ContextTypes.DEFAULT_TYPE):
     """JobQueue callback: polls API and notifies subscribers on busy->not-busy transition."""
-    global prev_states
+    global gpu_names, prev_states
 
     app = context.application
-    # NO-PROXY session to call Ferdowsi API
-    session = get_session_for_app(app, use_proxy=False)
+    if not subscriptions:
+        # nobody to notify: skip the request. Forget the last known state and
+        # the cached keyboard/validators so polling resumes from scratch (no
+        # stale /status, no false transitions on the first poll).
+        gpu_names = prev_states = ()
+        for key in ("subscribe_kb", "last_sig", "gpu_validators"):
+            app.bot_data.pop(key, None)
+        return
+    session = app.bot_data["http_session"]
 
     try:
-        gpus = await fetch_gpus(session)
-        if gpus is None:
+        gpus, validators = await fetch_gpus_conditional(
+            session, app.bot_data.get("gpu_validators")
+        )
+        if gpus is None or gpus is _UNCHANGED:
             return
 
-        current_states: Dict[str, bool] = {}
-        for g in gpus:
-            name = g.get("name")
-            disp = g.get("display_name") or name
-            busy = bool(g.get("busy"))
-            gpu_display_names[name] = disp
-            current_states[name] = busy
+        # parallel tuples, one entry per named GPU in response order
+        rows = [
+            (g["name"], bool(g.get("busy")), g.get("display_name") or g["name"])
+            for g in gpus
+            if g.get("name")
+        ]
+        if rows:
+            names, busies, disps = zip(*rows)
+        else:
+            names, busies, disps = (), (), ()
+
+        # cheap fingerprint of the response; skip all work when nothing changed
+        sig = hash((names, busies, disps))
+        if sig == app.bot_data.get("last_sig"):
+            app.bot_data["gpu_validators"] = validators
+            return
+        app.bot_data["subscribe_kb"] = build_subscribe_keyboard(gpus)
+        # only keep names present in the current response
+        gpu_display_names.clear()
+        gpu_display_names.update(zip(names, disps))
 
         # detect transitions busy -> not busy
-        for name, busy in current_states.items():
-            prev_busy = prev_states.get(name)
-            if prev_busy is True and busy is False:
-                targets = subscriptions.get(name, [])
-                if targets:
-                    message = f"\U0001f6a8 {gpu_display_names.get(name, name)} is now AVAILABLE!\nGPU id: {name}"
-                    for chat_id in targets.copy():
-                        try:
-                            await app.bot.send_message(chat_id=chat_id, text=message)
-                        except Exception as e:
-                            logger.warning(
-                                "Failed to send notification to %s: %s", chat_id, e
-                            )
-
-        prev_states = current_states
+        if names == gpu_names:
+            flipped = [
+                n for n, b, pb in zip(names, busies, prev_states) if pb and not b
+            ]
+        else:
+            prev = dict(zip(gpu_names, prev_states))
+            flipped = [n for n, b in zip(names, busies) if prev.get(n) and not b]
+
+        # one message per chat, listing every watched GPU that just freed up
+        per_chat: DefaultDict[int, List[str]] = defaultdict(list)
+        for name in flipped:
+            for chat_id in subscriptions.get(name, ()):
+                per_chat[chat_id].append(name)
+        # chats waiting on the same GPUs get the same text, sent once and copied
+        groups: DefaultDict[Tuple[str, ...], List[int]] = defaultdict(list)
+        for chat_id, freed in per_chat.items():
+            groups[tuple(freed)].append(chat_id)
+        await asyncio.gather(
+            *(
+                notify_chats(app, chats, format_notification(freed))
+                for freed, chats in groups.items()
+            )
+        )
+
+        gpu_names, prev_states = names, busies
+        # only now that this response is fully processed may later polls
+        # skip it: a failure above means the next poll refetches and retries
+        app.bot_data["last_sig"] = sig
+        app.bot_data["gpu_validators"] = validators
 
     except Exception:
         logger.exception("Poller job error")
@@ -293,7 +506,28 @@ def main():
         logger.error("TELEGRAM_TOKEN environment variable not set. Exiting.")
         return
 
-    app = ApplicationBuilder().token(TELEGRAM_TOKEN).build()
+    if sys.platform != "win32":
+        # run_polling() will create its event loop through uvloop's policy
+        import uvloop
+
+        uvloop.install()
+
+    # only chat_data is persisted: bot_data holds the live aiohttp session
+    persistence = PicklePersistence(
+        filepath=STATE_FILE,
+        store_data=PersistenceInput(
+            bot_data=False, chat_data=True, user_data=False, callback_data=False
+        ),
+        update_interval=PERSISTENCE_INTERVAL_SECONDS,
+    )
+    app = (
+        ApplicationBuilder()
+        .token(TELEGRAM_TOKEN)
+        .persistence(persistence)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
     # Commands
     app.add_handler(CommandHandler("start", start))
@@ -304,22 +538,19 @@ def main():
     app.add_handler(CommandHandler("status", status_command))
     app.add_handler(CallbackQueryHandler(callback_handler))
 
-    # schedule the poller via JobQueue (runs in the application's event loop)
-    app.job_queue.run_repeating(poller_job, interval=POLL_INTERVAL_SECONDS, first=0)
+    # schedule the poller via JobQueue (runs in the application's event loop).
+    # Ticks are fixed-rate. APScheduler's default max_instances=1 skips a tick
+    # while the previous poll is still running, so slow polls never pile up;
+    # misfire_grace_time lets a tick that fires up to 2s late still run.
+    app.job_queue.run_repeating(
+        poller_job,
+        interval=POLL_INTERVAL_SECONDS,
+        first=0,
+        name="gpu_poll",
+        job_kwargs={"misfire_grace_time": 2},
+    )
 
-    try:
-        app.run_polling()
-    finally:
-        # cleanup: try to close both aiohttp sessions if they were created
-        sess_keys = ["http_session_proxy", "http_session_noproxy"]
-        for key in sess_keys:
-            session = app.bot_data.get(key)
-            if session is not None:
-                try:
-                    # after run_polling() returns there should be no running loop, so safe to run a new one to close
-                    asyncio.run(session.close())
-                except Exception as e:
-                    logger.warning("Failed to close session %s: %s", key, e)
+    app.run_polling()
 
 
 if __name__ == "__main__":